@@ -2,11 +2,9 @@
 
 import pandas as pd
 from dagster import AssetOut, OpExecutionContext, Output, asset, multi_asset
-from dagster_dbt import DbtCli, DbtManifest, dbt_assets
+from dagster_dbt import DbtCli, dbt_assets
 
-from ..constants import MANIFEST_PATH
-
-manifest = DbtManifest.read(path=MANIFEST_PATH)
+from ..constants import manifest
 
 
 @asset(
@@ -1,14 +1,12 @@
 import json
 
 from dagster import DailyPartitionsDefinition, OpExecutionContext
-from dagster_dbt import DbtCli, DbtManifest, dbt_assets
+from dagster_dbt import DbtCli, dbt_assets
 
-from ..constants import MANIFEST_PATH
+from ..constants import manifest
 
 DBT_SELECT_SEED = "resource_type:seed"
 
-manifest = DbtManifest.read(path=MANIFEST_PATH)
-
 
 @dbt_assets(manifest=manifest, select=DBT_SELECT_SEED)
 def dbt_seed_assets(context: OpExecutionContext, dbt: DbtCli):
@@ -1,27 +1,31 @@
-from dagster import OpExecutionContext, Output
-from dagster_dbt import DbtCli, DbtManifest, dbt_assets
-from dateutil import parser
+from datetime import datetime
 
-from ..constants import MANIFEST_PATH
+from dagster import OpExecutionContext, Output
+from dagster_dbt import DbtCli, dbt_assets
 
-manifest = DbtManifest.read(path=MANIFEST_PATH)
+from ..constants import manifest
 
 
 @dbt_assets(manifest=manifest)
 def my_dbt_assets(context: OpExecutionContext, dbt: DbtCli):
     for event in dbt.cli(["build"], context=context).stream_raw_events():
+        # The timing information is shared across every Output emitted for the same dbt event,
+        # so only compute it once, and only if the event emits an Output.
+        metadata = None
+
         for dagster_event in event.to_default_asset_events(manifest=manifest):
             if isinstance(dagster_event, Output):
-                event_node_info = event.raw_event["data"]["node_info"]
+                if metadata is None:
+                    event_node_info = event.raw_event["data"]["node_info"]
 
-                started_at = parser.isoparse(event_node_info["node_started_at"])
-                completed_at = parser.isoparse(event_node_info["node_finished_at"])
+                    started_at = datetime.fromisoformat(event_node_info["node_started_at"])
+                    completed_at = datetime.fromisoformat(event_node_info["node_finished_at"])
 
-                metadata = {
-                    "Execution Started At": started_at.isoformat(timespec="seconds"),
-                    "Execution Completed At": completed_at.isoformat(timespec="seconds"),
-                    "Execution Duration": (completed_at - started_at).total_seconds(),
-                }
+                    metadata = {
+                        "Execution Started At": started_at.isoformat(timespec="seconds"),
+                        "Execution Completed At": completed_at.isoformat(timespec="seconds"),
+                        "Execution Duration": (completed_at - started_at).total_seconds(),
+                    }
 
                 context.add_output_metadata(
                     metadata=metadata,
@@ -2,11 +2,9 @@
 import sys
 
 from dagster import OpExecutionContext
-from dagster_dbt import DbtCli, DbtManifest, dbt_assets
+from dagster_dbt import DbtCli, dbt_assets
 
-from ..constants import MANIFEST_PATH
-
-manifest = DbtManifest.read(path=MANIFEST_PATH)
+from ..constants import manifest
 
 
 @dbt_assets(manifest=manifest)
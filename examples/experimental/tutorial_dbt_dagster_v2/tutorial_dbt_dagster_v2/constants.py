@@ -1,4 +1,8 @@
 from dagster import file_relative_path
+from dagster_dbt import DbtManifest
 
 DBT_PROJECT_DIR = file_relative_path(__file__, "../jaffle_shop")
 MANIFEST_PATH = file_relative_path(__file__, "../jaffle_shop/target/manifest.json")
+
+# Read the manifest once, so that every module using it shares the same parsed copy.
+manifest = DbtManifest.read(path=MANIFEST_PATH)
@@ -1,9 +1,7 @@
 from dagster import AssetMaterialization, Output, job, op
-from dagster_dbt import DbtCli, DbtManifest
+from dagster_dbt import DbtCli
 
-from ..constants import MANIFEST_PATH
-
-manifest = DbtManifest.read(path=MANIFEST_PATH)
+from ..constants import manifest
 
 
 @op
@@ -1,8 +1,4 @@
-from dagster_dbt import DbtManifest
-
-from ..constants import MANIFEST_PATH
-
-manifest = DbtManifest.read(path=MANIFEST_PATH)
+from ..constants import manifest
 
 daily_dbt_assets_schedule = manifest.build_schedule(
     job_name="all_dbt_assets",
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import List, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Extra, StrictInt, StrictStr, validator
 
 from ...utils import kubernetes
 
@@ -16,13 +16,30 @@ class IngressTLSConfiguration(BaseModel):
     enabled: bool
     secretName: str
 
+    class Config:
+        allow_mutation = False
+        extra = Extra.forbid
+
 
 # Enforce as HTTPIngressPath: see https://github.com/dagster-io/dagster/issues/3184
 class IngressPath(BaseModel):
     path: str
     pathType: IngressPathType
     serviceName: str
-    servicePort: Union[str, int]
+    servicePort: Union[StrictInt, StrictStr]
+
+    class Config:
+        allow_mutation = False
+        extra = Extra.forbid
+
+    @validator("servicePort", pre=True)
+    def coerce_numeric_service_port(cls, v: Union[str, int]) -> Union[str, int]:
+        # Resolve numeric ports to an int once here, so that the union does not coerce across
+        # branches and consumers can rely on the port's type.
+        if isinstance(v, str) and v.isdigit():
+            return int(v)
+
+        return v
 
 
 class DagitIngressConfiguration(BaseModel):
@@ -33,6 +50,10 @@ class DagitIngressConfiguration(BaseModel):
     precedingPaths: List[IngressPath]
     succeedingPaths: List[IngressPath]
 
+    class Config:
+        allow_mutation = False
+        extra = Extra.forbid
+
 
 class FlowerIngressConfiguration(BaseModel):
     host: str
@@ -42,12 +63,21 @@ class FlowerIngressConfiguration(BaseModel):
     precedingPaths: List[IngressPath]
     succeedingPaths: List[IngressPath]
 
+    class Config:
+        allow_mutation = False
+        extra = Extra.forbid
+
 
 class Ingress(BaseModel):
     enabled: bool
     apiVersion: Optional[str]
+    ingressClassName: Optional[str]
     labels: kubernetes.Labels
     annotations: kubernetes.Annotations
     dagit: DagitIngressConfiguration
     readOnlyDagit: DagitIngressConfiguration
     flower: FlowerIngressConfiguration
+
+    class Config:
+        allow_mutation = False
+        extra = Extra.forbid
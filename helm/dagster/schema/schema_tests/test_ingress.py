@@ -240,3 +240,23 @@ def test_ingress_labels(template_function, output, model, api_version):
     ingress = ingress_template[0]
 
     assert ingress.metadata.labels["foo"] == "bar"
+
+
+@pytest.mark.parametrize(
+    argnames=["service_port", "expected_service_port"],
+    argvalues=[
+        (80, 80),
+        ("80", 80),
+        ("use-annotation", "use-annotation"),
+    ],
+)
+def test_ingress_path_service_port(service_port, expected_service_port):
+    ingress_path = IngressPath(
+        path="/*",
+        pathType=IngressPathType.IMPLEMENTATION_SPECIFIC,
+        serviceName="ssl-redirect",
+        servicePort=service_port,
+    )
+
+    assert ingress_path.servicePort == expected_service_port
+    assert type(ingress_path.servicePort) is type(expected_service_port)
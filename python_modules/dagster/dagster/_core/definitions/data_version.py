@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import functools
-from collections import OrderedDict
+import itertools
 from enum import Enum
 from hashlib import sha256
 from typing import (
@@ -21,11 +21,10 @@
 
 from dagster import _check as check
 from dagster._annotations import deprecated, experimental
-from dagster._utils.cached_method import cached_method
 
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_graph import AssetGraph
-    from dagster._core.definitions.events import AssetKey, AssetMaterialization, AssetObservation
+    from dagster._core.definitions.events import AssetKey
     from dagster._core.event_api import EventLogRecord
     from dagster._core.events.log import EventLogEntry
     from dagster._core.instance import DagsterInstance
@@ -64,6 +63,12 @@ def __new__(
             value=check.str_param(value, "value"),
         )
 
+    @classmethod
+    def _unchecked_new(cls, value: str) -> DataVersion:
+        # Skips param validation. Only for internal callers that are known to pass a `str`, such as
+        # when reading versions back from event tags.
+        return super(DataVersion, cls).__new__(cls, value=value)
+
 
 @experimental
 class DataVersionsByPartition(
@@ -94,6 +99,16 @@ def __new__(
 NULL_DATA_VERSION: Final[DataVersion] = DataVersion("NULL")
 UNKNOWN_DATA_VERSION: Final[DataVersion] = DataVersion("UNKNOWN")
 
+_SENTINEL_DATA_VERSIONS: Final[Mapping[str, DataVersion]] = {
+    v.value: v for v in (DEFAULT_DATA_VERSION, NULL_DATA_VERSION, UNKNOWN_DATA_VERSION)
+}
+
+
+def _data_version_from_str(value: str) -> DataVersion:
+    # Data versions read back from event tags resolve to the sentinel instances when they match
+    # one, so that they aren't reallocated for every event.
+    return _SENTINEL_DATA_VERSIONS.get(value) or DataVersion._unchecked_new(value)  # noqa: SLF001
+
 
 class DataProvenance(
     NamedTuple(
@@ -135,22 +150,36 @@ def __new__(
             is_user_provided=check.bool_param(is_user_provided, "is_user_provided"),
         )
 
+    @classmethod
+    def _unchecked_new(
+        cls,
+        code_version: str,
+        input_data_versions: Mapping["AssetKey", DataVersion],
+        is_user_provided: bool,
+    ) -> DataProvenance:
+        # Skips param validation, which scans every entry of `input_data_versions`. Only for internal
+        # callers that construct the fields themselves, such as `from_tags`.
+        return super(DataProvenance, cls).__new__(
+            cls,
+            code_version=code_version,
+            input_data_versions=input_data_versions,
+            is_user_provided=is_user_provided,
+        )
+
     @staticmethod
     def from_tags(tags: Mapping[str, str]) -> Optional[DataProvenance]:
-        from dagster._core.definitions.events import AssetKey
-
         code_version = tags.get(CODE_VERSION_TAG)
         if code_version is None:
             return None
         input_data_versions = {
-            # Everything after the 2nd slash is the asset key
-            AssetKey.from_user_string(k.split("/", maxsplit=2)[-1]): DataVersion(tags[k])
+            _asset_key_from_tag(k): _data_version_from_str(v)
             for k, v in tags.items()
-            if k.startswith(INPUT_DATA_VERSION_TAG_PREFIX)
-            or k.startswith(_OLD_INPUT_DATA_VERSION_TAG_PREFIX)
+            if k.startswith(_INPUT_DATA_VERSION_TAG_PREFIXES)
         }
         is_user_provided = tags.get(DATA_VERSION_IS_USER_PROVIDED_TAG) == "true"
-        return DataProvenance(code_version, input_data_versions, is_user_provided)
+        return DataProvenance._unchecked_new(  # noqa: SLF001
+            code_version, input_data_versions, is_user_provided
+        )
 
     @property
     @deprecated
@@ -167,17 +196,30 @@ def input_logical_versions(self) -> Mapping["AssetKey", DataVersion]:
 CODE_VERSION_TAG: Final[str] = "dagster/code_version"
 INPUT_DATA_VERSION_TAG_PREFIX: Final[str] = "dagster/input_data_version"
 _OLD_INPUT_DATA_VERSION_TAG_PREFIX: Final[str] = "dagster/input_logical_version"
+_INPUT_DATA_VERSION_TAG_PREFIXES: Final[Tuple[str, ...]] = (
+    INPUT_DATA_VERSION_TAG_PREFIX,
+    _OLD_INPUT_DATA_VERSION_TAG_PREFIX,
+)
 INPUT_EVENT_POINTER_TAG_PREFIX: Final[str] = "dagster/input_event_pointer"
 DATA_VERSION_IS_USER_PROVIDED_TAG = "dagster/data_version_is_user_provided"
 
 
+# The same input tag keys recur across every materialization of an asset, so cache the parsed keys.
+@functools.lru_cache(maxsize=8192)
+def _asset_key_from_tag(tag: str) -> AssetKey:
+    from dagster._core.definitions.events import AssetKey
+
+    # Everything after the 2nd slash is the asset key
+    return AssetKey.from_user_string(tag.split("/", maxsplit=2)[-1])
+
+
 def read_input_data_version_from_tags(
     tags: Mapping[str, str], input_key: "AssetKey"
 ) -> Optional[DataVersion]:
     value = tags.get(
         get_input_data_version_tag(input_key, prefix=INPUT_DATA_VERSION_TAG_PREFIX)
     ) or tags.get(get_input_data_version_tag(input_key, prefix=_OLD_INPUT_DATA_VERSION_TAG_PREFIX))
-    return DataVersion(value) if value is not None else None
+    return _data_version_from_str(value) if value is not None else None
 
 
 def get_input_data_version_tag(
@@ -195,6 +237,14 @@ def get_input_event_pointer_tag(input_key: "AssetKey") -> str:
 # ########################
 
 
+# Input data versions are hashed in order of the `str` of their asset key. Rendering an `AssetKey`
+# as a string reprs its path list, so memoize it since the same asset keys recur across
+# materializations.
+@functools.lru_cache(maxsize=4096)
+def _input_data_version_sort_key(asset_key: AssetKey) -> str:
+    return str(asset_key)
+
+
 def compute_logical_data_version(
     code_version: Union[str, UnknownValue],
     input_data_versions: Mapping["AssetKey", DataVersion],
@@ -221,14 +271,12 @@ def compute_logical_data_version(
     ):
         return UNKNOWN_DATA_VERSION
 
-    ordered_input_versions = [
-        input_data_versions[k] for k in sorted(input_data_versions.keys(), key=str)
-    ]
-    all_inputs = (code_version, *(v.value for v in ordered_input_versions))
-
-    hash_sig = sha256()
-    hash_sig.update(bytearray("".join(all_inputs), "utf8"))
-    return DataVersion(hash_sig.hexdigest())
+    # Feeding each component to the hash in turn produces the same digest as hashing their
+    # concatenation, without building the intermediate list, tuple and joined string.
+    hash_sig = sha256(code_version.encode("utf8"))
+    for k in sorted(input_data_versions.keys(), key=_input_data_version_sort_key):
+        hash_sig.update(input_data_versions[k].value.encode("utf8"))
+    return DataVersion._unchecked_new(hash_sig.hexdigest())  # noqa: SLF001
 
 
 def extract_data_version_from_entry(
@@ -236,7 +284,7 @@ def extract_data_version_from_entry(
 ) -> Optional[DataVersion]:
     tags = entry.tags or {}
     value = tags.get(DATA_VERSION_TAG) or tags.get(_OLD_DATA_VERSION_TAG)
-    return None if value is None else DataVersion(value)
+    return None if value is None else _data_version_from_str(value)
 
 
 def extract_data_provenance_from_entry(
@@ -288,6 +336,18 @@ class CachingStaleStatusResolver:
     _asset_graph: Optional["AssetGraph"]
     _asset_graph_load_fn: Optional[Callable[[], "AssetGraph"]]
 
+    # Results are memoized in plain dicts keyed by asset key rather than with `cached_method`. These
+    # methods recurse through the asset graph and are hit many times per key, so the overhead of
+    # building a `cached_method` cache key on every call dominates the cost of a cache hit.
+    _status_cache: Dict[AssetKey, StaleStatus]
+    _stale_causes_cache: Dict[AssetKey, Sequence[StaleCause]]
+    _stale_root_causes_cache: Dict[AssetKey, Sequence[StaleCause]]
+    _current_data_version_cache: Dict[AssetKey, DataVersion]
+    _is_current_data_version_user_provided_cache: Dict[AssetKey, bool]
+    _current_data_provenance_cache: Dict[AssetKey, Optional[DataProvenance]]
+    _is_partitioned_or_downstream_cache: Dict[AssetKey, bool]
+    _latest_data_version_record_cache: Dict[AssetKey, Optional["EventLogRecord"]]
+
     def __init__(
         self,
         instance: "DagsterInstance",
@@ -303,6 +363,14 @@ def __init__(
         else:
             self._asset_graph = None
             self._asset_graph_load_fn = asset_graph
+        self._status_cache = {}
+        self._stale_causes_cache = {}
+        self._stale_root_causes_cache = {}
+        self._current_data_version_cache = {}
+        self._is_current_data_version_user_provided_cache = {}
+        self._current_data_provenance_cache = {}
+        self._is_partitioned_or_downstream_cache = {}
+        self._latest_data_version_record_cache = {}
 
     def get_status(self, key: AssetKey) -> StaleStatus:
         return self._get_status(key=key)
@@ -316,8 +384,12 @@ def get_stale_root_causes(self, key: AssetKey) -> Sequence[StaleCause]:
     def get_current_data_version(self, key: AssetKey) -> DataVersion:
         return self._get_current_data_version(key=key)
 
-    @cached_method
     def _get_status(self, key: AssetKey) -> StaleStatus:
+        if key not in self._status_cache:
+            self._status_cache[key] = self._compute_status(key)
+        return self._status_cache[key]
+
+    def _compute_status(self, key: AssetKey) -> StaleStatus:
         current_version = self._get_current_data_version(key=key)
         if current_version == NULL_DATA_VERSION:
             return StaleStatus.MISSING
@@ -327,8 +399,12 @@ def _get_status(self, key: AssetKey) -> StaleStatus:
             causes = self._get_stale_causes(key=key)
             return StaleStatus.FRESH if len(causes) == 0 else StaleStatus.STALE
 
-    @cached_method
     def _get_stale_causes(self, key: AssetKey) -> Sequence[StaleCause]:
+        if key not in self._stale_causes_cache:
+            self._stale_causes_cache[key] = self._compute_stale_causes(key)
+        return self._stale_causes_cache[key]
+
+    def _compute_stale_causes(self, key: AssetKey) -> Sequence[StaleCause]:
         current_version = self._get_current_data_version(key=key)
         if (
             current_version == NULL_DATA_VERSION
@@ -428,25 +504,33 @@ def _get_stale_causes_materialized(self, key: AssetKey) -> Iterator[StaleCause]:
                         ],
                     )
 
-    @cached_method
     def _get_stale_root_causes(self, key: AssetKey) -> Sequence[StaleCause]:
+        if key not in self._stale_root_causes_cache:
+            self._stale_root_causes_cache[key] = self._compute_stale_root_causes(key)
+        return self._stale_root_causes_cache[key]
+
+    def _compute_stale_root_causes(self, key: AssetKey) -> Sequence[StaleCause]:
         causes = self._get_stale_causes(key=key)
-        root_pairs = sorted([pair for cause in causes for pair in self._gather_leaves(cause)])
-        # After sorting the pairs, we can drop the level and de-dup using an
-        # ordered dict as an ordered set. This will give us unique root causes,
+        root_pairs = sorted(itertools.chain.from_iterable(self._gather_leaves(c) for c in causes))
+        # After sorting the pairs, we can drop the level and de-dup using a
+        # dict as an ordered set. This will give us unique root causes,
         # sorted by level.
-        roots: Dict[StaleCause, None] = OrderedDict()
-        for root_cause in [leaf_cause for _, leaf_cause in root_pairs]:
+        roots: Dict[StaleCause, None] = {}
+        for _, root_cause in root_pairs:
             roots[root_cause] = None
-        return list(roots.keys())
-
-    # The leaves of the cause tree for an asset are the root causes of its staleness.
-    def _gather_leaves(self, cause: StaleCause, level: int = 0) -> Iterator[Tuple[int, StaleCause]]:
-        if cause.children is None:
-            yield (level, cause)
-        else:
-            for child in cause.children:
-                yield from self._gather_leaves(child, level=level + 1)
+        return list(roots)
+
+    # The leaves of the cause tree for an asset are the root causes of its staleness. The tree is
+    # walked with an explicit stack rather than recursive generators to avoid allocating a generator
+    # frame per node. Children are pushed in reverse so leaves are yielded in depth-first order.
+    def _gather_leaves(self, cause: StaleCause) -> Iterator[Tuple[int, StaleCause]]:
+        stack = [(0, cause)]
+        while stack:
+            level, current = stack.pop()
+            if current.children is None:
+                yield (level, current)
+            else:
+                stack.extend((level + 1, child) for child in reversed(current.children))
 
     @property
     def asset_graph(self) -> "AssetGraph":
@@ -464,8 +548,12 @@ def instance_queryer(self) -> "CachingInstanceQueryer":
             self._instance_queryer = CachingInstanceQueryer(self._instance, self.asset_graph)
         return self._instance_queryer
 
-    @cached_method
     def _get_current_data_version(self, *, key: AssetKey) -> DataVersion:
+        if key not in self._current_data_version_cache:
+            self._current_data_version_cache[key] = self._compute_current_data_version(key)
+        return self._current_data_version_cache[key]
+
+    def _compute_current_data_version(self, key: AssetKey) -> DataVersion:
         # Currently we can only use asset records, which are fetched in one shot, for non-source
         # assets. This is because the most recent AssetObservation is not stored on the AssetRecord.
         record = self._get_latest_data_version_record(key=key)
@@ -477,59 +565,81 @@ def _get_current_data_version(self, *, key: AssetKey) -> DataVersion:
             data_version = extract_data_version_from_entry(record.event_log_entry)
             return data_version or DEFAULT_DATA_VERSION
 
-    @cached_method
     def _is_current_data_version_user_provided(self, *, key: AssetKey) -> bool:
+        if key not in self._is_current_data_version_user_provided_cache:
+            self._is_current_data_version_user_provided_cache[
+                key
+            ] = self._compute_is_current_data_version_user_provided(key)
+        return self._is_current_data_version_user_provided_cache[key]
+
+    def _compute_is_current_data_version_user_provided(self, key: AssetKey) -> bool:
         if self.asset_graph.is_source(key):
             return True
         else:
             provenance = self._get_current_data_provenance(key=key)
             return provenance is not None and provenance.is_user_provided
 
-    @cached_method
     def _get_current_data_provenance(self, *, key: AssetKey) -> Optional[DataProvenance]:
+        if key not in self._current_data_provenance_cache:
+            self._current_data_provenance_cache[key] = self._compute_current_data_provenance(key)
+        return self._current_data_provenance_cache[key]
+
+    def _compute_current_data_provenance(self, key: AssetKey) -> Optional[DataProvenance]:
         record = self._get_latest_data_version_record(key=key)
         if record is None:
             return None
         else:
             return extract_data_provenance_from_entry(record.event_log_entry)
 
-    @cached_method
     def _is_partitioned_or_downstream(self, *, key: AssetKey) -> bool:
-        if self.asset_graph.get_partitions_def(key):
-            return True
-        elif self.asset_graph.is_source(key):
-            return False
-        else:
-            return any(
-                self._is_partitioned_or_downstream(key=dep_key)
-                for dep_key in self.asset_graph.get_parents(key)
-            )
-
-    # Volatility means that an asset is assumed to be constantly changing. We assume that observable
-    # source assets are non-volatile, since the primary purpose of the observation function is to
-    # determine if a source asset has changed. We assume that regular assets are volatile if they
-    # are at the root of the graph (have no dependencies) or are downstream of a volatile asset.
-    @cached_method
-    def _is_volatile(self, *, key: AssetKey) -> bool:
-        if self.asset_graph.is_source(key):
-            return self.asset_graph.is_observable(key)
-        else:
-            deps = self.asset_graph.get_parents(key)
-            return len(deps) == 0 or any(self._is_volatile(key=dep_key) for dep_key in deps)
+        if key not in self._is_partitioned_or_downstream_cache:
+            self._is_partitioned_or_downstream_cache[
+                key
+            ] = self._compute_is_partitioned_or_downstream(key)
+        return self._is_partitioned_or_downstream_cache[key]
+
+    # Ancestors are resolved with an explicit stack rather than recursion. Every ancestor visited
+    # along the way is cached, so the upstream graph of each asset is only walked once per resolver.
+    # Self-dependencies (e.g. a time-partitioned asset reading its previous partition) are skipped.
+    def _compute_is_partitioned_or_downstream(self, key: AssetKey) -> bool:
+        cache = self._is_partitioned_or_downstream_cache
+        stack = [key]
+        while stack:
+            current = stack[-1]
+            if current in cache:
+                stack.pop()
+            elif self.asset_graph.get_partitions_def(current):
+                cache[current] = True
+                stack.pop()
+            elif self.asset_graph.is_source(current):
+                cache[current] = False
+                stack.pop()
+            else:
+                deps = [
+                    dep_key
+                    for dep_key in self.asset_graph.get_parents(current)
+                    if dep_key != current
+                ]
+                if any(cache.get(dep_key) for dep_key in deps):
+                    cache[current] = True
+                    stack.pop()
+                else:
+                    unresolved = [dep_key for dep_key in deps if dep_key not in cache]
+                    if unresolved:
+                        stack.extend(unresolved)
+                    else:
+                        cache[current] = False
+                        stack.pop()
+        return cache[key]
 
-    @cached_method
-    def _get_latest_data_version_event(
-        self, *, key: AssetKey
-    ) -> Optional[Union["AssetMaterialization", "AssetObservation"]]:
-        record = self._get_latest_data_version_record(key=key)
-        if record:
-            entry = record.event_log_entry
-            return entry.asset_materialization or entry.asset_observation
-        else:
-            return None
-
-    @cached_method
     def _get_latest_data_version_record(self, key: AssetKey) -> Optional["EventLogRecord"]:
+        if key not in self._latest_data_version_record_cache:
+            self._latest_data_version_record_cache[key] = self._compute_latest_data_version_record(
+                key
+            )
+        return self._latest_data_version_record_cache[key]
+
+    def _compute_latest_data_version_record(self, key: AssetKey) -> Optional["EventLogRecord"]:
         from dagster._core.definitions.events import AssetKeyPartitionKey
 
         # If an asset record is cached, all of its ancestors have already been cached.
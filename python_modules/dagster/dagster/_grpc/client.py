@@ -269,8 +269,9 @@ def external_partition_set_execution_params(self, partition_set_execution_param_
             PartitionSetExecutionParamArgs,
         )
 
-        chunks = list(
-            self._streaming_query(
+        return "".join(
+            chunk.serialized_chunk
+            for chunk in self._streaming_query(
                 "ExternalPartitionSetExecutionParams",
                 api_pb2.ExternalPartitionSetExecutionParamsRequest,
                 serialized_partition_set_execution_param_args=serialize_value(
@@ -279,8 +280,6 @@ def external_partition_set_execution_params(self, partition_set_execution_param_
             )
         )
 
-        return "".join([chunk.serialized_chunk for chunk in chunks])
-
     def external_pipeline_subset(self, pipeline_subset_snapshot_args):
         check.inst_param(
             pipeline_subset_snapshot_args,
@@ -362,8 +361,9 @@ def external_schedule_execution(self, external_schedule_execution_args):
             ExternalScheduleExecutionArgs,
         )
 
-        chunks = list(
-            self._streaming_query(
+        return "".join(
+            chunk.serialized_chunk
+            for chunk in self._streaming_query(
                 "ExternalScheduleExecution",
                 api_pb2.ExternalScheduleExecutionRequest,
                 serialized_external_schedule_execution_args=serialize_value(
@@ -372,8 +372,6 @@ def external_schedule_execution(self, external_schedule_execution_args):
             )
         )
 
-        return "".join([chunk.serialized_chunk for chunk in chunks])
-
     def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_TIMEOUT):
         check.inst_param(
             sensor_execution_args,
@@ -388,8 +386,9 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
             " left off."
         )
 
-        chunks = list(
-            self._streaming_query(
+        return "".join(
+            chunk.serialized_chunk
+            for chunk in self._streaming_query(
                 "ExternalSensorExecution",
                 api_pb2.ExternalSensorExecutionRequest,
                 timeout=timeout,
@@ -398,8 +397,6 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
             )
         )
 
-        return "".join([chunk.serialized_chunk for chunk in chunks])
-
     def external_notebook_data(self, notebook_path: str):
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
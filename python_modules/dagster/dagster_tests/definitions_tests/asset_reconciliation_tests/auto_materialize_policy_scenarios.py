@@ -36,11 +36,23 @@
     two_partitions_partitions_def,
 )
 
-single_lazy_asset = [asset_def("asset1", auto_materialize_policy=AutoMaterializePolicy.lazy())]
+# shared across scenarios, rather than constructing a new policy for each asset
+eager_policy = AutoMaterializePolicy.eager()
+lazy_policy = AutoMaterializePolicy.lazy()
+
+# expanded once up front, as several scenarios below share these ranges
+hourly_keys_jan5_4am_to_jan7_3am = hourly_partitions_def.get_partition_keys_in_range(
+    PartitionKeyRange(start="2013-01-05-04:00", end="2013-01-07-03:00")
+)
+hourly_keys_jan5_midnight_to_3am = hourly_partitions_def.get_partition_keys_in_range(
+    PartitionKeyRange(start="2013-01-05-00:00", end="2013-01-05-03:00")
+)
+
+single_lazy_asset = [asset_def("asset1", auto_materialize_policy=lazy_policy)]
 single_lazy_asset_with_freshness_policy = [
     asset_def(
         "asset1",
-        auto_materialize_policy=AutoMaterializePolicy.lazy(),
+        auto_materialize_policy=lazy_policy,
         freshness_policy=FreshnessPolicy(maximum_lag_minutes=60),
     )
 ]
@@ -49,8 +61,8 @@
     asset_def("root2"),
     asset_def("A", ["root1"]),
     asset_def("B", ["A"]),
-    asset_def("C", ["B"], auto_materialize_policy=AutoMaterializePolicy.eager()),
-    asset_def("D", ["root2", "C"], auto_materialize_policy=AutoMaterializePolicy.eager()),
+    asset_def("C", ["B"], auto_materialize_policy=eager_policy),
+    asset_def("D", ["root2", "C"], auto_materialize_policy=eager_policy),
 ]
 
 time_partitioned_eager_after_non_partitioned = [
@@ -60,12 +72,12 @@
         "time_partitioned",
         ["unpartitioned_root_a"],
         partitions_def=hourly_partitions_def,
-        auto_materialize_policy=AutoMaterializePolicy.eager(),
+        auto_materialize_policy=eager_policy,
     ),
     asset_def(
         "unpartitioned_downstream",
         ["time_partitioned", "unpartitioned_root_b"],
-        auto_materialize_policy=AutoMaterializePolicy.eager(),
+        auto_materialize_policy=eager_policy,
     ),
 ]
 static_partitioned_eager_after_non_partitioned = [
@@ -83,7 +95,7 @@
     asset_def(
         "auto",
         ["non_auto"],
-        auto_materialize_policy=AutoMaterializePolicy.lazy(),
+        auto_materialize_policy=lazy_policy,
         freshness_policy=FreshnessPolicy(maximum_lag_minutes=60),
     ),
 ]
@@ -95,10 +107,10 @@ def with_auto_materialize_policy(
     """Note: this should be implemented in core dagster at some point, and this implementation is
     a lazy hack.
     """
-    ret = []
-    for assets_def in assets_defs:
-        ret.append(assets_def.with_attributes(auto_materialize_policy=auto_materialize_policy))
-    return ret
+    return [
+        assets_def.with_attributes(auto_materialize_policy=auto_materialize_policy)
+        for assets_def in assets_defs
+    ]
 
 
 # auto materialization policies
@@ -114,9 +126,7 @@ def with_auto_materialize_policy(
         expected_run_requests=[run_request(asset_keys=["asset1"])],
     ),
     "auto_materialize_policy_eager_with_freshness_policies": AssetReconciliationScenario(
-        assets=with_auto_materialize_policy(
-            overlapping_freshness_inf, AutoMaterializePolicy.eager()
-        ),
+        assets=with_auto_materialize_policy(overlapping_freshness_inf, eager_policy),
         cursor_from=AssetReconciliationScenario(
             assets=overlapping_freshness_inf,
             unevaluated_runs=[run(["asset1", "asset2", "asset3", "asset4", "asset5", "asset6"])],
@@ -128,9 +138,7 @@ def with_auto_materialize_policy(
         ],
     ),
     "auto_materialize_policy_lazy_with_freshness_policies": AssetReconciliationScenario(
-        assets=with_auto_materialize_policy(
-            overlapping_freshness_inf, AutoMaterializePolicy.lazy()
-        ),
+        assets=with_auto_materialize_policy(overlapping_freshness_inf, lazy_policy),
         cursor_from=AssetReconciliationScenario(
             assets=overlapping_freshness_inf,
             unevaluated_runs=[run(["asset1", "asset2", "asset3", "asset4", "asset5", "asset6"])],
@@ -142,7 +150,7 @@ def with_auto_materialize_policy(
     "auto_materialize_policy_with_default_scope_hourly_to_daily_partitions_never_materialized": AssetReconciliationScenario(
         assets=with_auto_materialize_policy(
             hourly_to_daily_partitions,
-            AutoMaterializePolicy.eager(),
+            eager_policy,
         ),
         unevaluated_runs=[],
         current_time=create_pendulum_time(year=2013, month=1, day=7, hour=4),
@@ -170,25 +178,19 @@ def with_auto_materialize_policy(
         current_time=create_pendulum_time(year=2013, month=1, day=7, hour=4),
         expected_run_requests=[
             run_request(asset_keys=["hourly"], partition_key=partition_key)
-            for partition_key in hourly_partitions_def.get_partition_keys_in_range(
-                PartitionKeyRange(start="2013-01-05-04:00", end="2013-01-07-03:00")
-            )
+            for partition_key in hourly_keys_jan5_4am_to_jan7_3am
         ],
         expected_conditions={
             **{
                 ("hourly", p): {MissingAutoMaterializeCondition()}
-                for p in hourly_partitions_def.get_partition_keys_in_range(
-                    PartitionKeyRange(start="2013-01-05-4:00", end="2013-01-07-03:00")
-                )
+                for p in hourly_keys_jan5_4am_to_jan7_3am
             },
             **{
                 ("hourly", p): {
                     MaxMaterializationsExceededAutoMaterializeCondition(),
                     MissingAutoMaterializeCondition(),
                 }
-                for p in hourly_partitions_def.get_partition_keys_in_range(
-                    PartitionKeyRange(start="2013-01-05-00:00", end="2013-01-05-03:00")
-                )
+                for p in hourly_keys_jan5_midnight_to_3am
             },
             ("daily", "2013-01-05"): {
                 ParentOutdatedAutoMaterializeCondition(
@@ -218,15 +220,13 @@ def with_auto_materialize_policy(
         current_time=create_pendulum_time(year=2013, month=1, day=7, hour=4),
         expected_run_requests=[
             run_request(asset_keys=["hourly"], partition_key=partition_key)
-            for partition_key in hourly_partitions_def.get_partition_keys_in_range(
-                PartitionKeyRange(start="2013-01-05-04:00", end="2013-01-07-03:00")
-            )
+            for partition_key in hourly_keys_jan5_4am_to_jan7_3am
         ],
     ),
     "auto_materialize_policy_lazy_parent_rematerialized_one_partition": AssetReconciliationScenario(
         assets=with_auto_materialize_policy(
             two_assets_in_sequence_one_partition,
-            AutoMaterializePolicy.lazy(),
+            lazy_policy,
         ),
         unevaluated_runs=[
             run(["asset1", "asset2"], partition_key="a"),
@@ -300,7 +300,7 @@ def with_auto_materialize_policy(
     "auto_materialize_policy_daily_to_unpartitioned_freshness": AssetReconciliationScenario(
         assets=with_auto_materialize_policy(
             daily_to_unpartitioned,
-            AutoMaterializePolicy.eager(),
+            eager_policy,
         ),
         unevaluated_runs=[],
         current_time=create_pendulum_time(year=2020, month=2, day=7, hour=4),
@@ -309,7 +309,7 @@ def with_auto_materialize_policy(
     "auto_materialize_policy_diamond_duplicate_conditions": AssetReconciliationScenario(
         assets=with_auto_materialize_policy(
             diamond,
-            AutoMaterializePolicy.eager(),
+            eager_policy,
         ),
         unevaluated_runs=[run(["asset1", "asset2", "asset3", "asset4"]), run(["asset1", "asset2"])],
         expected_run_requests=[run_request(asset_keys=["asset3", "asset4"])],
@@ -323,7 +323,7 @@ def with_auto_materialize_policy(
             *diamond[0:3],
             *with_auto_materialize_policy(
                 diamond[-1:],
-                AutoMaterializePolicy.eager(),
+                eager_policy,
             ),
         ],
         asset_selection=AssetSelection.keys("asset4"),
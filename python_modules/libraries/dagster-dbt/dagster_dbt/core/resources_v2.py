@@ -671,11 +671,13 @@ def to_default_asset_events(
             )
         elif node_resource_type == NodeType.Test and is_node_finished:
             upstream_unique_ids: List[str] = manifest.raw_manifest["parent_map"][unique_id]
+            nodes: Mapping[str, Dict[str, Any]] = manifest.raw_manifest["nodes"]
+            sources: Mapping[str, Dict[str, Any]] = manifest.raw_manifest["sources"]
 
             for upstream_unique_id in upstream_unique_ids:
-                upstream_node_info: Dict[str, Any] = manifest.raw_manifest["nodes"].get(
+                upstream_node_info: Dict[str, Any] = nodes.get(upstream_unique_id) or sources.get(
                     upstream_unique_id
-                ) or manifest.raw_manifest["sources"].get(upstream_unique_id)
+                )
                 upstream_asset_key = manifest.node_info_to_asset_key(upstream_node_info)
 
                 yield AssetObservation(
@@ -1,37 +1,95 @@
 import os
+import shutil
 import subprocess
+from pathlib import Path
+from typing import Iterator
 
 import dbt.version
 import pytest
+from dagster import DagsterInstance
+from dagster._core.test_utils import instance_for_test
 from dagster._utils import file_relative_path, pushd
-from dagster_dbt import DbtCli, DbtCliClientResource, dbt_cli_resource
+from dagster_dbt import DbtCli, DbtCliClientResource, DbtManifest, dbt_cli_resource
 from packaging import version
 
+try:
+    # orjson parses the (potentially multi-MB) manifests noticeably faster than the stdlib.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # ======= CONFIG ========
 DBT_EXECUTABLE = "dbt"
 TEST_PROJECT_DIR = file_relative_path(__file__, "dagster_dbt_test_project")
-DBT_CONFIG_DIR = TEST_PROJECT_DIR
-TEST_DBT_TARGET_DIR = os.path.join(TEST_PROJECT_DIR, "target_test")
 
 TEST_PYTHON_PROJECT_DIR = file_relative_path(__file__, "dagster_dbt_python_test_project")
 DBT_PYTHON_CONFIG_DIR = TEST_PYTHON_PROJECT_DIR
 
+TEST_PROJECT_MANIFEST_PATH = os.path.join(TEST_PROJECT_DIR, "manifest.json")
+SAMPLE_MANIFEST_PATH = file_relative_path(__file__, "sample_manifest.json")
+TEST_DAGSTER_METADATA_MANIFEST_PATH = file_relative_path(
+    __file__, "dbt_projects/test_dagster_metadata/manifest.json"
+)
+
 IS_BUILDKITE = os.getenv("BUILDKITE") is not None
 
+# Set by pytest-xdist in each worker process, e.g. "gw0".
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
+
+def _load_manifest(path: str) -> DbtManifest:
+    # Parse the raw bytes, which lets orjson skip decoding the file to `str` first.
+    return DbtManifest(raw_manifest=json_loads(Path(path).read_bytes()))
+
+
+@pytest.fixture(scope="session")
+def test_project_dir(tmp_path_factory):
+    if not XDIST_WORKER:
+        return TEST_PROJECT_DIR
+
+    # When running with pytest-xdist, give each worker a private copy of the dbt project so that
+    # concurrent invocations don't race on `target/` or the duckdb database.
+    worker_project_dir = tmp_path_factory.mktemp(XDIST_WORKER).joinpath(
+        os.path.basename(TEST_PROJECT_DIR)
+    )
+    shutil.copytree(
+        TEST_PROJECT_DIR,
+        worker_project_dir,
+        ignore=shutil.ignore_patterns("target", "target_test", "logs", "*.duckdb"),
+    )
+
+    return str(worker_project_dir)
+
+
+@pytest.fixture(scope="session")
+def test_project_manifest() -> DbtManifest:
+    return _load_manifest(TEST_PROJECT_MANIFEST_PATH)
+
+
+@pytest.fixture(scope="session")
+def sample_manifest() -> DbtManifest:
+    return _load_manifest(SAMPLE_MANIFEST_PATH)
+
+
+@pytest.fixture(scope="session")
+def test_dagster_metadata_manifest() -> DbtManifest:
+    return _load_manifest(TEST_DAGSTER_METADATA_MANIFEST_PATH)
+
 
 @pytest.fixture(scope="session")
-def test_project_dir():
-    return TEST_PROJECT_DIR
+def instance() -> Iterator[DagsterInstance]:
+    with instance_for_test() as instance:
+        yield instance
 
 
 @pytest.fixture(scope="session")
-def dbt_config_dir():
-    return DBT_CONFIG_DIR
+def dbt_config_dir(test_project_dir):
+    return test_project_dir
 
 
 @pytest.fixture(scope="session")
-def dbt_target_dir():
-    return TEST_DBT_TARGET_DIR
+def dbt_target_dir(test_project_dir):
+    return os.path.join(test_project_dir, "target_test")
 
 
 @pytest.fixture(scope="session")
@@ -79,13 +137,13 @@ def dbt_cli_resource_factory(request):
 
 
 @pytest.fixture(scope="session")
-def dbt_seed(dbt_executable, dbt_config_dir):
-    with pushd(TEST_PROJECT_DIR):
+def dbt_seed(test_project_dir, dbt_executable, dbt_config_dir):
+    with pushd(test_project_dir):
         subprocess.run([dbt_executable, "seed", "--profiles-dir", dbt_config_dir], check=True)
 
 
 @pytest.fixture(scope="session")
-def dbt_build(dbt_executable, dbt_config_dir):
-    with pushd(TEST_PROJECT_DIR):
+def dbt_build(test_project_dir, dbt_executable, dbt_config_dir):
+    with pushd(test_project_dir):
         subprocess.run([dbt_executable, "seed", "--profiles-dir", dbt_config_dir], check=True)
         subprocess.run([dbt_executable, "run", "--profiles-dir", dbt_config_dir], check=True)
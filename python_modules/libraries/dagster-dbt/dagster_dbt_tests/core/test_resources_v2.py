@@ -3,7 +3,14 @@
 from typing import List, Optional
 
 import pytest
-from dagster import AssetObservation, FloatMetadataValue, Output, TextMetadataValue, materialize
+from dagster import (
+    AssetObservation,
+    DagsterInstance,
+    FloatMetadataValue,
+    Output,
+    TextMetadataValue,
+    materialize,
+)
 from dagster_dbt import dbt_assets
 from dagster_dbt.core.resources_v2 import (
     PARTIAL_PARSE_FILE_NAME,
@@ -13,20 +20,46 @@
 )
 from dagster_dbt.errors import DagsterDbtCliRuntimeError
 
-from ..conftest import TEST_PROJECT_DIR
-
 pytest.importorskip("dbt.version", minversion="1.4")
 
 
-manifest_path = Path(TEST_PROJECT_DIR).joinpath("manifest.json")
-manifest = DbtManifest.read(path=manifest_path)
+@pytest.fixture(name="partial_parse_seed", scope="module")
+def partial_parse_seed_fixture(
+    dbt_seed, test_project_dir: str, test_project_manifest: DbtManifest
+) -> None:
+    """Parse the test project once, so that `DbtCli.cli` invocations in the tests that request this
+    fixture copy `target/partial_parse.msgpack` into their unique target path rather than parsing
+    from scratch.
+
+    Depends on `dbt_seed`, since the `dbt run` invocations in this module read from the seeds.
+    """
+    partial_parse_file_path = Path(test_project_dir, "target", PARTIAL_PARSE_FILE_NAME)
+    if partial_parse_file_path.exists():
+        return
+
+    dbt_parse_task = DbtCli(project_dir=test_project_dir).cli(
+        ["parse"], manifest=test_project_manifest
+    )
+    dbt_parse_task.wait()
+
+    partial_parse_file_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy(
+        Path(test_project_dir, dbt_parse_task.target_path, PARTIAL_PARSE_FILE_NAME),
+        partial_parse_file_path,
+    )
 
 
 @pytest.mark.parametrize("global_config_flags", [[], ["--debug"]])
 @pytest.mark.parametrize("command", ["run", "parse"])
-def test_dbt_cli(global_config_flags: List[str], command: str) -> None:
-    dbt = DbtCli(project_dir=TEST_PROJECT_DIR, global_config_flags=global_config_flags)
-    dbt_cli_task = dbt.cli([command], manifest=manifest)
+def test_dbt_cli(
+    partial_parse_seed: None,
+    test_project_dir: str,
+    test_project_manifest: DbtManifest,
+    global_config_flags: List[str],
+    command: str,
+) -> None:
+    dbt = DbtCli(project_dir=test_project_dir, global_config_flags=global_config_flags)
+    dbt_cli_task = dbt.cli([command], manifest=test_project_manifest)
 
     dbt_cli_task.wait()
 
@@ -35,9 +68,9 @@ def test_dbt_cli(global_config_flags: List[str], command: str) -> None:
     assert dbt_cli_task.process.returncode == 0
 
 
-def test_dbt_cli_failure() -> None:
-    dbt = DbtCli(project_dir=TEST_PROJECT_DIR)
-    dbt_cli_task = dbt.cli(["run", "--profiles-dir", "nonexistent"], manifest=manifest)
+def test_dbt_cli_failure(test_project_dir: str, test_project_manifest: DbtManifest) -> None:
+    dbt = DbtCli(project_dir=test_project_dir)
+    dbt_cli_task = dbt.cli(["run", "--profiles-dir", "nonexistent"], manifest=test_project_manifest)
 
     with pytest.raises(DagsterDbtCliRuntimeError):
         dbt_cli_task.wait()
@@ -46,13 +79,15 @@ def test_dbt_cli_failure() -> None:
     assert dbt_cli_task.process.returncode == 2
 
 
-def test_dbt_cli_get_artifact() -> None:
-    dbt = DbtCli(project_dir=TEST_PROJECT_DIR)
+def test_dbt_cli_get_artifact(
+    partial_parse_seed: None, test_project_dir: str, test_project_manifest: DbtManifest
+) -> None:
+    dbt = DbtCli(project_dir=test_project_dir)
 
-    dbt_cli_task_1 = dbt.cli(["run"], manifest=manifest)
+    dbt_cli_task_1 = dbt.cli(["run"], manifest=test_project_manifest)
     dbt_cli_task_1.wait()
 
-    dbt_cli_task_2 = dbt.cli(["compile"], manifest=manifest)
+    dbt_cli_task_2 = dbt.cli(["compile"], manifest=test_project_manifest)
     dbt_cli_task_2.wait()
 
     # `dbt run` produces a manifest.json and run_results.json
@@ -75,69 +110,86 @@ def test_dbt_cli_get_artifact() -> None:
     assert manifest_json_1 != manifest_json_2
 
 
-def test_dbt_profile_configuration(monkeypatch) -> None:
-    dbt = DbtCli(project_dir=TEST_PROJECT_DIR, profile="duckdb", target="dev")
+def test_dbt_profile_configuration(
+    monkeypatch, partial_parse_seed: None, test_project_dir: str, test_project_manifest: DbtManifest
+) -> None:
+    dbt = DbtCli(project_dir=test_project_dir, profile="duckdb", target="dev")
 
-    dbt_cli_task = dbt.cli(["parse"], manifest=manifest)
+    dbt_cli_task = dbt.cli(["parse"], manifest=test_project_manifest)
     dbt_cli_task.wait()
 
     assert dbt_cli_task.process.args == ["dbt", "parse", "--profile", "duckdb", "--target", "dev"]
     assert dbt_cli_task.is_successful()
 
 
-def test_dbt_without_partial_parse() -> None:
-    dbt = DbtCli(project_dir=TEST_PROJECT_DIR)
+def _clean_project(project_dir: str) -> None:
+    """Equivalent to `dbt clean` for the `clean-targets` of the test project, without paying for a
+    dbt subprocess.
+    """
+    for clean_target in ["target", "dbt_modules"]:
+        shutil.rmtree(Path(project_dir, clean_target), ignore_errors=True)
 
-    dbt.cli(["clean"], manifest=manifest).wait()
 
-    dbt_cli_compile_without_partial_parse_task = dbt.cli(["compile"], manifest=manifest)
+def test_dbt_without_partial_parse(
+    test_project_dir: str, test_project_manifest: DbtManifest
+) -> None:
+    dbt = DbtCli(project_dir=test_project_dir)
 
-    assert dbt_cli_compile_without_partial_parse_task.is_successful()
-    assert any(
-        "Unable to do partial parsing" in event.raw_event["info"]["msg"]
-        for event in dbt_cli_compile_without_partial_parse_task.stream_raw_events()
+    _clean_project(test_project_dir)
+
+    dbt_cli_compile_without_partial_parse_task = dbt.cli(
+        ["compile"], manifest=test_project_manifest
     )
+    events = dbt_cli_compile_without_partial_parse_task.wait()
+
+    assert dbt_cli_compile_without_partial_parse_task.is_successful()
+    assert any("Unable to do partial parsing" in event.raw_event["info"]["msg"] for event in events)
 
 
-def test_dbt_with_partial_parse() -> None:
-    dbt = DbtCli(project_dir=TEST_PROJECT_DIR)
+def test_dbt_with_partial_parse(test_project_dir: str, test_project_manifest: DbtManifest) -> None:
+    dbt = DbtCli(project_dir=test_project_dir)
 
-    dbt.cli(["clean"], manifest=manifest).wait()
+    _clean_project(test_project_dir)
 
     # Run `dbt compile` to generate the partial parse file
-    dbt_cli_compile_task = dbt.cli(["compile"], manifest=manifest)
+    dbt_cli_compile_task = dbt.cli(["compile"], manifest=test_project_manifest)
     dbt_cli_compile_task.wait()
 
     # Copy the partial parse file to the target directory
     partial_parse_file_path = Path(
-        TEST_PROJECT_DIR, dbt_cli_compile_task.target_path, PARTIAL_PARSE_FILE_NAME
+        test_project_dir, dbt_cli_compile_task.target_path, PARTIAL_PARSE_FILE_NAME
     )
-    original_target_path = Path(TEST_PROJECT_DIR, "target", PARTIAL_PARSE_FILE_NAME)
+    original_target_path = Path(test_project_dir, "target", PARTIAL_PARSE_FILE_NAME)
 
     original_target_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy(partial_parse_file_path, Path(TEST_PROJECT_DIR, "target", PARTIAL_PARSE_FILE_NAME))
+    shutil.copy(partial_parse_file_path, Path(test_project_dir, "target", PARTIAL_PARSE_FILE_NAME))
 
     # Assert that partial parsing was used.
-    dbt_cli_compile_with_partial_parse_task = dbt.cli(["compile"], manifest=manifest)
-    dbt_cli_compile_with_partial_parse_task.wait()
+    dbt_cli_compile_with_partial_parse_task = dbt.cli(["compile"], manifest=test_project_manifest)
+    events = dbt_cli_compile_with_partial_parse_task.wait()
 
     assert dbt_cli_compile_with_partial_parse_task.is_successful()
+    assert events
     assert not any(
-        "Unable to do partial parsing" in event.raw_event["info"]["msg"]
-        for event in dbt_cli_compile_with_partial_parse_task.stream_raw_events()
+        "Unable to do partial parsing" in event.raw_event["info"]["msg"] for event in events
     )
 
 
-def test_dbt_cli_subsetted_execution() -> None:
+def test_dbt_cli_subsetted_execution(
+    partial_parse_seed: None,
+    instance: DagsterInstance,
+    test_project_dir: str,
+    test_project_manifest: DbtManifest,
+) -> None:
     @dbt_assets(
-        manifest=manifest,
+        manifest=test_project_manifest,
         select=(
             "fqn:dagster_dbt_test_project.subdir.least_caloric"
             " fqn:dagster_dbt_test_project.sort_by_calories"
         ),
     )
     def my_dbt_assets(context):
-        dbt = DbtCli(project_dir=TEST_PROJECT_DIR)
+        dbt = DbtCli(project_dir=test_project_dir)
         dbt_cli_task = dbt.cli(["run"], context=context)
 
         dbt_cli_task.wait()
@@ -155,14 +207,20 @@ def my_dbt_assets(context):
 
         yield from dbt_cli_task.stream()
 
-    assert materialize([my_dbt_assets]).success
+    assert materialize([my_dbt_assets], instance=instance).success
 
 
 @pytest.mark.parametrize("exclude", [None, "fqn:dagster_dbt_test_project.subdir.least_caloric"])
-def test_dbt_cli_default_selection(exclude: Optional[str]) -> None:
-    @dbt_assets(manifest=manifest, exclude=exclude)
+def test_dbt_cli_default_selection(
+    partial_parse_seed: None,
+    instance: DagsterInstance,
+    test_project_dir: str,
+    test_project_manifest: DbtManifest,
+    exclude: Optional[str],
+) -> None:
+    @dbt_assets(manifest=test_project_manifest, exclude=exclude)
     def my_dbt_assets(context):
-        dbt = DbtCli(project_dir=TEST_PROJECT_DIR)
+        dbt = DbtCli(project_dir=test_project_dir)
         dbt_cli_task = dbt.cli(["run"], context=context)
 
         dbt_cli_task.wait()
@@ -176,7 +234,7 @@ def my_dbt_assets(context):
 
         yield from dbt_cli_task.stream()
 
-    assert materialize([my_dbt_assets]).success
+    assert materialize([my_dbt_assets], instance=instance).success
 
 
 @pytest.mark.parametrize(
@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from typing import AbstractSet, Any, Mapping, Optional
 
@@ -17,26 +16,24 @@
 from dagster_dbt.core.resources_v2 import DbtManifest
 
 manifest_path = Path(__file__).parent.joinpath("sample_manifest.json")
-manifest = DbtManifest.read(path=manifest_path)
-
-test_dagster_metadata_manifest_path = Path(__file__).parent.joinpath(
-    "dbt_projects", "test_dagster_metadata", "manifest.json"
-)
-test_dagster_metadata_manifest = DbtManifest.read(path=test_dagster_metadata_manifest_path)
 
 
-def test_materialize(test_project_dir):
-    @dbt_assets(manifest=manifest)
+def test_materialize(instance, test_project_dir, sample_manifest):
+    @dbt_assets(manifest=sample_manifest)
     def all_dbt_assets(context, dbt: DbtCli):
         yield from dbt.cli(["build"], context=context).stream()
 
     assert materialize(
-        [all_dbt_assets], resources={"dbt": DbtCli(project_dir=test_project_dir)}
+        [all_dbt_assets],
+        resources={"dbt": DbtCli(project_dir=test_project_dir)},
+        instance=instance,
     ).success
 
 
-@pytest.mark.parametrize("manifest", [json.load(manifest_path.open()), manifest_path])
-def test_manifest_argument(manifest):
+@pytest.mark.parametrize("manifest_type", ["dict", "path"])
+def test_manifest_argument(sample_manifest: DbtManifest, manifest_type: str):
+    manifest = sample_manifest.raw_manifest if manifest_type == "dict" else manifest_path
+
     @dbt_assets(manifest=manifest)
     def my_dbt_assets():
         ...
@@ -143,10 +140,13 @@ def my_dbt_assets():
     ],
 )
 def test_selections(
-    select: Optional[str], exclude: Optional[str], expected_asset_names: AbstractSet[str]
+    sample_manifest: DbtManifest,
+    select: Optional[str],
+    exclude: Optional[str],
+    expected_asset_names: AbstractSet[str],
 ) -> None:
     @dbt_assets(
-        manifest=manifest,
+        manifest=sample_manifest,
         select=select or "fqn:*",
         exclude=exclude,
     )
@@ -164,8 +164,10 @@ def my_dbt_assets():
 @pytest.mark.parametrize(
     "partitions_def", [None, DailyPartitionsDefinition(start_date="2023-01-01")]
 )
-def test_partitions_def(partitions_def: Optional[PartitionsDefinition]) -> None:
-    @dbt_assets(manifest=manifest, partitions_def=partitions_def)
+def test_partitions_def(
+    sample_manifest: DbtManifest, partitions_def: Optional[PartitionsDefinition]
+) -> None:
+    @dbt_assets(manifest=sample_manifest, partitions_def=partitions_def)
     def my_dbt_assets():
         ...
 
@@ -173,8 +175,8 @@ def my_dbt_assets():
 
 
 @pytest.mark.parametrize("io_manager_key", [None, "my_io_manager_key"])
-def test_io_manager_key(io_manager_key: Optional[str]) -> None:
-    @dbt_assets(manifest=manifest, io_manager_key=io_manager_key)
+def test_io_manager_key(sample_manifest: DbtManifest, io_manager_key: Optional[str]) -> None:
+    @dbt_assets(manifest=sample_manifest, io_manager_key=io_manager_key)
     def my_dbt_assets():
         ...
 
@@ -184,13 +186,13 @@ def my_dbt_assets():
         assert output_def.io_manager_key == expected_io_manager_key
 
 
-def test_with_asset_key_replacements() -> None:
+def test_with_asset_key_replacements(sample_manifest: DbtManifest) -> None:
     class CustomizedDbtManifest(DbtManifest):
         @classmethod
         def node_info_to_asset_key(cls, node_info: Mapping[str, Any]) -> AssetKey:
             return AssetKey(["prefix", *super().node_info_to_asset_key(node_info).path])
 
-    manifest = CustomizedDbtManifest.read(path=manifest_path)
+    manifest = CustomizedDbtManifest(raw_manifest=sample_manifest.raw_manifest)
 
     @dbt_assets(manifest=manifest)
     def my_dbt_assets():
@@ -207,7 +209,7 @@ def my_dbt_assets():
     }
 
 
-def test_with_description_replacements() -> None:
+def test_with_description_replacements(sample_manifest: DbtManifest) -> None:
     expected_description = "customized description"
 
     class CustomizedDbtManifest(DbtManifest):
@@ -215,7 +217,7 @@ class CustomizedDbtManifest(DbtManifest):
         def node_info_to_description(cls, node_info: Mapping[str, Any]) -> str:
             return expected_description
 
-    manifest = CustomizedDbtManifest.read(path=manifest_path)
+    manifest = CustomizedDbtManifest(raw_manifest=sample_manifest.raw_manifest)
 
     @dbt_assets(manifest=manifest)
     def my_dbt_assets():
@@ -225,7 +227,7 @@ def my_dbt_assets():
         assert description == expected_description
 
 
-def test_with_metadata_replacements() -> None:
+def test_with_metadata_replacements(sample_manifest: DbtManifest) -> None:
     expected_metadata = {"customized": "metadata"}
 
     class CustomizedDbtManifest(DbtManifest):
@@ -233,7 +235,7 @@ class CustomizedDbtManifest(DbtManifest):
         def node_info_to_metadata(cls, node_info: Mapping[str, Any]) -> Mapping[str, Any]:
             return expected_metadata
 
-    manifest = CustomizedDbtManifest.read(path=manifest_path)
+    manifest = CustomizedDbtManifest(raw_manifest=sample_manifest.raw_manifest)
 
     @dbt_assets(manifest=manifest)
     def my_dbt_assets():
@@ -243,7 +245,7 @@ def my_dbt_assets():
         assert metadata["customized"] == "metadata"
 
 
-def test_dbt_meta_auto_materialize_policy() -> None:
+def test_dbt_meta_auto_materialize_policy(test_dagster_metadata_manifest: DbtManifest) -> None:
     @dbt_assets(manifest=test_dagster_metadata_manifest)
     def my_dbt_assets():
         ...
@@ -255,7 +257,7 @@ def my_dbt_assets():
         assert auto_materialize_policy == AutoMaterializePolicy.eager()
 
 
-def test_dbt_meta_freshness_policy() -> None:
+def test_dbt_meta_freshness_policy(test_dagster_metadata_manifest: DbtManifest) -> None:
     @dbt_assets(manifest=test_dagster_metadata_manifest)
     def my_dbt_assets():
         ...
@@ -269,7 +271,7 @@ def my_dbt_assets():
         )
 
 
-def test_dbt_meta_asset_key() -> None:
+def test_dbt_meta_asset_key(test_dagster_metadata_manifest: DbtManifest) -> None:
     @dbt_assets(manifest=test_dagster_metadata_manifest)
     def my_dbt_assets():
         ...
@@ -287,7 +289,7 @@ def my_dbt_assets():
     }.issubset(my_dbt_assets.keys)
 
 
-def test_dbt_config_group() -> None:
+def test_dbt_config_group(test_dagster_metadata_manifest: DbtManifest) -> None:
     @dbt_assets(manifest=test_dagster_metadata_manifest)
     def my_dbt_assets():
         ...
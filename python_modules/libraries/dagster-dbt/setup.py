@@ -48,6 +48,7 @@ def get_version() -> str:
             "dbt-duckdb",
             "dagster-duckdb",
             "dagster-duckdb-pandas",
+            "orjson",
         ]
     },
     entry_points={